@@ -9,11 +9,13 @@ Updates from v3:
 - Easier to click on thin or dashed guides
 """
 
+import bisect
 import json
 import os
 import sys
+import time
 from dataclasses import dataclass, asdict
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -24,9 +26,23 @@ GWL_EXSTYLE = -20
 WS_EX_LAYERED = 0x00080000
 WS_EX_TRANSPARENT = 0x00000020
 
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    # Resolved once with explicit signatures. The Ptr variants keep the full
+    # LONG_PTR on 64-bit Python; 32-bit user32 only exports the plain names.
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _GetWindowLongPtrW = getattr(_user32, 'GetWindowLongPtrW', _user32.GetWindowLongW)
+    _GetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLongPtrW.restype = ctypes.c_ssize_t
+    _SetWindowLongPtrW = getattr(_user32, 'SetWindowLongPtrW', _user32.SetWindowLongW)
+    _SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_ssize_t]
+    _SetWindowLongPtrW.restype = ctypes.c_ssize_t
+
 
 GUIDE_HIT_RADIUS = 15  # px - increased for easier interaction
 GUIDE_DRAG_RADIUS = 20  # px - larger area for dragging detection
+REPAINT_INTERVAL_MS = 16  # cap overlay repaints at ~60 Hz
 
 def get_settings_file_path():
     """Get the settings file path in the user's application data directory."""
@@ -54,6 +70,9 @@ STYLE_MAP = {
 }
 STYLE_NAMES = list(STYLE_MAP.keys())
 
+# Pens shared by every guide with the same (color, thickness, style_name)
+_PEN_PALETTE: Dict[tuple, QtGui.QPen] = {}
+
 @dataclass
 class Guide:
     orientation: str
@@ -62,15 +81,47 @@ class Guide:
     thickness: int = 2
     style_name: str = "Solid"
 
+    def __post_init__(self):
+        # Plain attributes rather than fields so asdict() keeps them out of the settings file
+        self._restyle()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Keep the palette key and pen in step with the style fields; skipped while
+        # the dataclass __init__ is still assigning fields (before __post_init__)
+        if name in ('color', 'thickness', 'style_name') and '_pen_key' in self.__dict__:
+            self._restyle()
+
+    def _restyle(self):
+        # Palette key doubles as the paint batching key
+        self._pen_key = (tuple(self.color), self.thickness, self.style_name)
+        self._pen: Optional[QtGui.QPen] = None
+
     def to_pen(self) -> QtGui.QPen:
-        pen = QtGui.QPen(QtGui.QColor(*self.color))
-        pen.setWidth(self.thickness)
-        pen.setStyle(STYLE_MAP.get(self.style_name, QtCore.Qt.SolidLine))
-        pen.setCosmetic(True)
-        return pen
+        """Return the guide's pen, shared with every guide drawn the same way.
+
+        The pen lives in a palette shared across guides and must not be modified;
+        change the guide's color, thickness or style_name instead.
+        """
+        if self._pen is None:
+            pen = _PEN_PALETTE.get(self._pen_key)
+            if pen is None:
+                pen = QtGui.QPen(QtGui.QColor(*self.color))
+                pen.setWidth(self.thickness)
+                pen.setStyle(STYLE_MAP.get(self.style_name, QtCore.Qt.SolidLine))
+                pen.setCosmetic(True)
+                _PEN_PALETTE[self._pen_key] = pen
+            self._pen = pen
+        return self._pen
+
+# Filled lazily: QPixmap/QIcon can only be created once a QApplication exists
+_ICON_CACHE: Dict[int, QtGui.QIcon] = {}
 
 def create_orange_cross_icon(size=64):
-    """Create the orange cross icon programmatically."""
+    """Create the orange cross icon programmatically, once per size."""
+    if size in _ICON_CACHE:
+        return _ICON_CACHE[size]
+
     pix = QtGui.QPixmap(size, size)
     pix.fill(QtCore.Qt.transparent)
     
@@ -106,11 +157,16 @@ def create_orange_cross_icon(size=64):
     painter.drawRoundedRect(v_rect, bar_thickness/2, bar_thickness/2)
     
     painter.end()
-    return QtGui.QIcon(pix)
+    _ICON_CACHE[size] = QtGui.QIcon(pix)
+    return _ICON_CACHE[size]
 
 class OverlayCanvas(QtWidgets.QWidget):
     guideChanged = QtCore.pyqtSignal()
 
+    # Double-clicks are included because QWidget forwards them to mousePressEvent
+    _MOUSE_EVENTS = (QtCore.QEvent.MouseMove, QtCore.QEvent.MouseButtonPress,
+                     QtCore.QEvent.MouseButtonRelease, QtCore.QEvent.MouseButtonDblClick)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
@@ -118,27 +174,120 @@ class OverlayCanvas(QtWidgets.QWidget):
         self.setMouseTracking(True)
 
         self._guides: List[Guide] = []
+        # (pos, index) pairs per orientation, kept sorted for bisect hit-testing
+        self._v_positions: List[Tuple[int, int]] = []
+        self._h_positions: List[Tuple[int, int]] = []
+        # Union of hover hit strips; None until rebuilt after a guide edit or resize
+        self._hit_region: Optional[QtGui.QRegion] = None
         self._hover_idx: Optional[int] = None
         self._positioning_idx: Optional[int] = None
         self._interactive = False
+        # Set while a drag has moved a guide; guideChanged is emitted once when it ends
+        self._dirty = False
+
+        # Off-screen layer holding every guide except the one being positioned
+        self._static_cache: Optional[QtGui.QPixmap] = None
+        self._static_cache_dirty = True
+        self._static_cache_excluded: Optional[int] = None
+
+        # Highlight pens, built once; only their width follows the highlighted guide
+        self._hl_pen_positioning = QtGui.QPen(QtGui.QColor(255, 255, 0, 200))  # Bright yellow
+        self._hl_pen_hover = QtGui.QPen(QtGui.QColor(255, 255, 0, 120))  # Softer yellow
+        for pen in (self._hl_pen_positioning, self._hl_pen_hover):
+            pen.setStyle(QtCore.Qt.SolidLine)
+            pen.setCosmetic(True)
+
+        # Coalesce update requests so fast mouse input can't outrun the display
+        self._pending_update = QtGui.QRegion()
+        self._repaint_timer = QtCore.QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self._flushUpdate)
+
+        # Drag moves arriving faster than the repaint interval are folded into the latest one
+        self._last_move_time = 0.0
+        self._pending_move: Optional[QtCore.QPoint] = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self._applyPendingMove)
+
+    def _scheduleUpdate(self, area: Union[QtCore.QRect, QtGui.QRegion, None] = None):
+        """Queue a repaint of area (whole widget if None), flushed at most once per interval."""
+        self._pending_update = self._pending_update.united(area if area is not None else self.rect())
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flushUpdate(self):
+        region, self._pending_update = self._pending_update, QtGui.QRegion()
+        if not region.isEmpty():
+            self.update(region)
 
     def setInteractive(self, enabled: bool):
         self._interactive = enabled
         # Click-through only if not interactive
         self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, not enabled)
         if not enabled:
+            self._updateGuide(self._positioning_idx)
+            self._updateGuide(self._hover_idx)
             self._positioning_idx = None
             self._hover_idx = None
-            self.update()
+            self._commitMove()
+
+    def _commitMove(self):
+        """Emit the guideChanged that was deferred while a guide was being dragged."""
+        if self._dirty:
+            self._dirty = False
+            self.guideChanged.emit()
+
+    def _guideRect(self, g: Guide) -> QtCore.QRect:
+        """Return the strip covered by a guide, including its widest highlight."""
+        hw = max(6, g.thickness + 6) // 2 + 1
+        if g.orientation == 'v':
+            return QtCore.QRect(g.pos - hw, 0, 2 * hw + 1, self.height())
+        return QtCore.QRect(0, g.pos - hw, self.width(), 2 * hw + 1)
+
+    def _updateGuide(self, index: Optional[int]):
+        """Schedule a repaint of just the strip of the guide at index."""
+        if index is not None and 0 <= index < len(self._guides):
+            self._scheduleUpdate(self._guideRect(self._guides[index]))
+
+    def _rebuildIndex(self):
+        """Rebuild the sorted per-orientation position lists from the guide list."""
+        self._v_positions = sorted((g.pos, i) for i, g in enumerate(self._guides) if g.orientation == 'v')
+        self._h_positions = sorted((g.pos, i) for i, g in enumerate(self._guides) if g.orientation == 'h')
+        self._hit_region = None
+        self._static_cache_dirty = True
+
+    def _hitRegion(self) -> QtGui.QRegion:
+        """Return the union of all guides' hover hit strips, rebuilding it if stale."""
+        if self._hit_region is None:
+            r = GUIDE_HIT_RADIUS
+            region = QtGui.QRegion()
+            for g in self._guides:
+                if g.orientation == 'v':
+                    region = region.united(QtCore.QRect(g.pos - r, 0, 2 * r + 1, self.height()))
+                else:
+                    region = region.united(QtCore.QRect(0, g.pos - r, self.width(), 2 * r + 1))
+            self._hit_region = region
+        return self._hit_region
+
+    def _positionsFor(self, g: Guide) -> List[Tuple[int, int]]:
+        return self._v_positions if g.orientation == 'v' else self._h_positions
 
     def addGuide(self, guide: Guide):
         self._guides.append(guide)
+        bisect.insort(self._positionsFor(guide), (guide.pos, len(self._guides) - 1))
+        self._hit_region = None
+        self._static_cache_dirty = True
         self.guideChanged.emit()
-        self.update()
+        self._scheduleUpdate(self._guideRect(guide))
 
     def removeGuideAt(self, index: int):
         if 0 <= index < len(self._guides):
+            band = self._guideRect(self._guides[index])
             del self._guides[index]
+            # Indices after the removed guide shift down, so rebuild rather than patch
+            self._rebuildIndex()
             
             # Fix indices after removal
             if self._positioning_idx is not None:
@@ -157,40 +306,54 @@ class OverlayCanvas(QtWidgets.QWidget):
                     # Adjust index since we removed a guide before it
                     self._hover_idx -= 1
             
+            # This emit also reports any drag in progress
+            self._dirty = False
             self.guideChanged.emit()
-            self.update()
+            self._scheduleUpdate(band)
 
     def clearGuides(self):
         if self._guides:
             self._guides.clear()
+            self._v_positions.clear()
+            self._h_positions.clear()
+            self._hit_region = None
+            self._static_cache_dirty = True
             # Reset all interaction state when clearing guides
             self._positioning_idx = None
             self._hover_idx = None
+            self._dirty = False
             self.guideChanged.emit()
-            self.update()
+            self._scheduleUpdate()
 
     def guides(self) -> List[Guide]:
         return self._guides
 
     def setGuides(self, guides: List[Guide]):
+        # Repaint only the strips of the outgoing and incoming guides
+        region = QtGui.QRegion()
+        for g in self._guides:
+            region = region.united(self._guideRect(g))
         self._guides = guides
+        self._rebuildIndex()
+        for g in self._guides:
+            region = region.united(self._guideRect(g))
         self._positioning_idx = None
         self._hover_idx = None
+        self._dirty = False
         self.guideChanged.emit()
-        self.update()
+        self._scheduleUpdate(region)
 
     def paintEvent(self, event: QtGui.QPaintEvent):
+        # Nothing to draw; Qt has already cleared the translucent background
+        if not self._guides:
+            return
+
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
-        painter.fillRect(self.rect(), QtCore.Qt.transparent)
 
-        # Draw all guides
-        for idx, g in enumerate(self._guides):
-            painter.setPen(g.to_pen())
-            if g.orientation == 'v':
-                painter.drawLine(g.pos, 0, g.pos, self.height())
-            else:
-                painter.drawLine(0, g.pos, self.width(), g.pos)
+        # Painting is clipped to the dirty region; the highlight is skipped outside it
+        region = event.region()
+        w, h = self.width(), self.height()
 
         # Highlight logic: show highlight if hovering OR positioning
         highlight_idx = None
@@ -202,31 +365,79 @@ class OverlayCanvas(QtWidgets.QWidget):
                 # Highlight the guide we're hovering over
                 highlight_idx = self._hover_idx
 
-        # Draw highlight
+        # Cached layer of every guide except the one being positioned, which is drawn
+        # live; rebuilt only after guide edits or when a drag starts or ends
+        moving_idx = self._positioning_idx if self._interactive else None
+        if (self._static_cache is None or self._static_cache_dirty or
+                self._static_cache_excluded != moving_idx):
+            self._renderStaticCache(moving_idx)
+
+        # Each guide is stroked once, on top of its highlight. A hovered guide lives in
+        # the cache, so its highlight goes down first and the cache is blitted over it;
+        # the positioned guide is drawn after the blit as highlight then stroke.
         if (highlight_idx is not None and 
-            0 <= highlight_idx < len(self._guides)):
+            0 <= highlight_idx < len(self._guides) and
+            region.intersects(self._guideRect(self._guides[highlight_idx]))):
             g = self._guides[highlight_idx]
             
             # Different highlight colors for different states
             if self._positioning_idx == highlight_idx:
-                # Bright yellow for positioning mode
-                highlight_color = QtGui.QColor(255, 255, 0, 200)
+                hl = self._hl_pen_positioning
                 highlight_width = max(6, g.thickness + 6)  # Increased for better visibility
             else:
-                # Softer yellow for hover
-                highlight_color = QtGui.QColor(255, 255, 0, 120)
+                hl = self._hl_pen_hover
                 highlight_width = max(4, g.thickness + 4)  # Increased for better visibility
-            
-            hl = QtGui.QPen(highlight_color)
-            hl.setWidth(highlight_width)
-            hl.setStyle(QtCore.Qt.SolidLine)
-            hl.setCosmetic(True)
-            painter.setPen(hl)
-            
+            if hl.width() != highlight_width:
+                hl.setWidth(highlight_width)
+
+            if g.orientation == 'v':
+                line = QtCore.QLine(g.pos, 0, g.pos, h)
+            else:
+                line = QtCore.QLine(0, g.pos, w, g.pos)
+            if highlight_idx == moving_idx:
+                painter.drawPixmap(0, 0, self._static_cache)
+                painter.setPen(hl)
+                painter.drawLine(line)
+                painter.setPen(g.to_pen())
+                painter.drawLine(line)
+            else:
+                painter.setPen(hl)
+                painter.drawLine(line)
+                painter.drawPixmap(0, 0, self._static_cache)
+        else:
+            painter.drawPixmap(0, 0, self._static_cache)
+
+    def _renderStaticCache(self, excluded: Optional[int]):
+        """Draw every guide except excluded into the off-screen layer."""
+        dpr = self.devicePixelRatioF()
+        if self._static_cache is None:
+            self._static_cache = QtGui.QPixmap(self.size() * dpr)
+            self._static_cache.setDevicePixelRatio(dpr)
+        self._static_cache.fill(QtCore.Qt.transparent)
+        w, h = self.width(), self.height()
+
+        # One drawLines() call per distinct pen
+        groups: Dict[tuple, Tuple[QtGui.QPen, List[QtCore.QLine]]] = {}
+        for idx, g in enumerate(self._guides):
+            if idx == excluded:
+                continue
+            group = groups.get(g._pen_key)
+            if group is None:
+                group = groups[g._pen_key] = (g.to_pen(), [])
             if g.orientation == 'v':
-                painter.drawLine(g.pos, 0, g.pos, self.height())
+                group[1].append(QtCore.QLine(g.pos, 0, g.pos, h))
             else:
-                painter.drawLine(0, g.pos, self.width(), g.pos)
+                group[1].append(QtCore.QLine(0, g.pos, w, g.pos))
+
+        painter = QtGui.QPainter(self._static_cache)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        for pen, lines in groups.values():
+            painter.setPen(pen)
+            painter.drawLines(lines)
+        painter.end()
+
+        self._static_cache_dirty = False
+        self._static_cache_excluded = excluded
 
     def _findGuideAt(self, pos: QtCore.QPoint, use_drag_radius: bool = False) -> Optional[int]:
         """Find a guide at the given position.
@@ -236,32 +447,76 @@ class OverlayCanvas(QtWidgets.QWidget):
             use_drag_radius: If True, use larger radius for easier dragging
         """
         radius = GUIDE_DRAG_RADIUS if use_drag_radius else GUIDE_HIT_RADIUS
-        
-        for i, g in enumerate(self._guides):
-            if g.orientation == 'v' and abs(pos.x() - g.pos) <= radius:
-                return i
-            elif g.orientation == 'h' and abs(pos.y() - g.pos) <= radius:
-                return i
-        return None
 
-    def mousePressEvent(self, e: QtGui.QMouseEvent):
-        if not self._interactive:
+        # Closest vertical and closest horizontal, then the nearer of the two
+        best = self._nearestIn(self._v_positions, pos.x())
+        h = self._nearestIn(self._h_positions, pos.y())
+        if h is not None and (best is None or h[0] < best[0]):
+            best = h
+        return best[1] if best is not None and best[0] <= radius else None
+
+    @staticmethod
+    def _nearestIn(positions: List[Tuple[int, int]], value: int) -> Optional[Tuple[int, int]]:
+        """Return (distance, index) of the entry nearest to value in a sorted position list."""
+        # The nearest entry is one of the two bracketing the insertion point
+        i = bisect.bisect_left(positions, (value, -1))
+        best = None
+        if i < len(positions):
+            p, idx = positions[i]
+            best = (p - value, idx)
+        if i > 0:
+            p, idx = positions[i - 1]
+            if best is None or value - p <= best[0]:
+                best = (value - p, idx)
+        return best
+
+    def event(self, e: QtCore.QEvent) -> bool:
+        if e.type() in self._MOUSE_EVENTS and not self._interactive:
+            # Click-through mode: leave the event unhandled without entering the Python handlers
+            return False
+        if e.type() == QtCore.QEvent.MouseMove and self._positioning_idx is not None:
+            elapsed_ms = (time.monotonic() - self._last_move_time) * 1000
+            if elapsed_ms < REPAINT_INTERVAL_MS:
+                # Too soon after the last handled move: keep only the newest position
+                self._pending_move = e.pos()
+                if not self._move_timer.isActive():
+                    self._move_timer.start(int(REPAINT_INTERVAL_MS - elapsed_ms) + 1)
+                return True
+            self._last_move_time = time.monotonic()
+            self._pending_move = None
+        elif e.type() == QtCore.QEvent.MouseButtonPress and self._pending_move is not None:
+            # Land the guide where the cursor last was before the click is handled
+            self._applyPendingMove()
+        return super().event(e)
+
+    def _applyPendingMove(self):
+        """Replay the last move buffered by event() while positioning a guide."""
+        self._move_timer.stop()
+        pos, self._pending_move = self._pending_move, None
+        if pos is None or self._positioning_idx is None:
             return
-        self._last_mouse_pos = e.pos()
-        
+        self._last_move_time = time.monotonic()
+        self.mouseMoveEvent(QtGui.QMouseEvent(QtCore.QEvent.MouseMove, QtCore.QPointF(pos),
+                                              QtCore.Qt.NoButton, QtCore.Qt.NoButton,
+                                              QtCore.Qt.NoModifier))
+
+    def mousePressEvent(self, e: QtGui.QMouseEvent):
         if e.button() == QtCore.Qt.LeftButton:
             # Use larger radius for initial click detection to make dragging easier
             idx = self._findGuideAt(e.pos(), use_drag_radius=True)
             
             if self._positioning_idx is None and idx is not None:
                 # Start positioning this guide
+                self._updateGuide(self._hover_idx)
                 self._positioning_idx = idx
                 self._hover_idx = idx  # Keep it highlighted while positioning
+                self._updateGuide(idx)
             elif self._positioning_idx is not None:
                 # Click to finish positioning (validate position)
+                self._updateGuide(self._positioning_idx)
                 self._positioning_idx = None
                 self._hover_idx = None  # Clear highlight after validation
-            self.update()
+                self._commitMove()
             
         elif e.button() == QtCore.Qt.RightButton:
             idx = self._findGuideAt(e.pos(), use_drag_radius=True)
@@ -278,35 +533,49 @@ class OverlayCanvas(QtWidgets.QWidget):
                 self.addGuide(Guide('v', e.x()))
 
     def mouseMoveEvent(self, e: QtGui.QMouseEvent):
-        if not self._interactive:
-            return
-        self._last_mouse_pos = e.pos()
-        
         if self._positioning_idx is not None:
             # We're currently positioning a guide
             # Safety check: make sure the positioning index is still valid
             if self._positioning_idx < len(self._guides):
                 g = self._guides[self._positioning_idx]
+                old_rect = self._guideRect(g)
+                positions = self._positionsFor(g)
+                del positions[bisect.bisect_left(positions, (g.pos, self._positioning_idx))]
                 if g.orientation == 'v':
                     g.pos = int(max(0, min(self.width() - 1, e.x())))
                 else:
                     g.pos = int(max(0, min(self.height() - 1, e.y())))
-                self.guideChanged.emit()
-                self.update()
+                bisect.insort(positions, (g.pos, self._positioning_idx))
+                self._hit_region = None
+                self._dirty = True
+                self._scheduleUpdate(old_rect.united(self._guideRect(g)))
             else:
                 # Invalid index, reset positioning
                 self._positioning_idx = None
                 self._hover_idx = None
-                self.update()
+                self._commitMove()
+                self._scheduleUpdate()
         else:
-            # Not positioning, check for hover (use normal radius for hover)
-            idx = self._findGuideAt(e.pos(), use_drag_radius=False)
+            # Not positioning, check for hover (use normal radius for hover).
+            # Most moves land away from every guide and stop at the region test.
+            if self._hitRegion().contains(e.pos()):
+                idx = self._findGuideAt(e.pos(), use_drag_radius=False)
+            else:
+                idx = None
             if idx != self._hover_idx:
+                self._updateGuide(self._hover_idx)
                 self._hover_idx = idx
-                self.update()
+                self._updateGuide(idx)
 
     def mouseReleaseEvent(self, e: QtGui.QMouseEvent):
-        pass
+        if self._positioning_idx is None:
+            self._commitMove()
+
+    def resizeEvent(self, e: QtGui.QResizeEvent):
+        # Hit strips and the cached guide layer span the full width/height
+        self._hit_region = None
+        self._static_cache = None
+        super().resizeEvent(e)
 
     def leaveEvent(self, e: QtCore.QEvent):
         """Clear hover highlight when mouse leaves the window."""
@@ -314,8 +583,8 @@ class OverlayCanvas(QtWidgets.QWidget):
             return
         # Only clear hover if we're not positioning (don't clear during drag)
         if self._positioning_idx is None and self._hover_idx is not None:
+            self._updateGuide(self._hover_idx)
             self._hover_idx = None
-            self.update()
 
 
 class ControlPanel(QtWidgets.QWidget):
@@ -438,7 +707,21 @@ class ControlPanel(QtWidgets.QWidget):
         except Exception:
             pass
 
+class SettingsReader(QtCore.QRunnable):
+    """Runs a settings read on a pool thread and emits the result through a signal."""
+
+    def __init__(self, read, loaded_signal):
+        super().__init__()
+        self._read = read
+        self._loaded_signal = loaded_signal
+
+    def run(self):
+        # The receiver lives in the GUI thread, so this emit is delivered queued
+        self._loaded_signal.emit(self._read())
+
 class MainWindow(QtWidgets.QMainWindow):
+    settingsLoaded = QtCore.pyqtSignal(dict)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Inkguiding")
@@ -486,13 +769,12 @@ class MainWindow(QtWidgets.QMainWindow):
         # State
         self._settings_mode = False
         self._guides_visible = True
+        # Saving is a no-op until the persisted settings have been applied
+        self._settings_loaded = False
         
         # Obtain native handle for Windows API
         self.hwnd = int(self.winId())
         self._apply_clickthrough()
-        
-        # Load persisted settings
-        self._load_settings()
 
         # Apply initial mode
         self._apply_modes()
@@ -500,17 +782,24 @@ class MainWindow(QtWidgets.QMainWindow):
         # Start full screen
         self.showFullScreen()
 
+        # Load persisted settings off the GUI thread so the overlay shows immediately
+        self.settingsLoaded.connect(self._apply_loaded_settings)
+        QtCore.QThreadPool.globalInstance().start(
+            SettingsReader(self._read_settings_from_disk, self.settingsLoaded))
+
     def _apply_clickthrough(self):
-        """Enable or disable true click-through depending on mode."""
-        style = ctypes.windll.user32.GetWindowLongW(self.hwnd, GWL_EXSTYLE)
+        """Enable or disable true click-through depending on mode (Windows only)."""
+        if sys.platform != "win32":
+            return
+        style = _GetWindowLongPtrW(self.hwnd, GWL_EXSTYLE)
         if not self._settings_mode:
             # Normal mode: add transparent flag
-            ctypes.windll.user32.SetWindowLongW(self.hwnd, GWL_EXSTYLE,
-                                                style | WS_EX_LAYERED | WS_EX_TRANSPARENT)
+            _SetWindowLongPtrW(self.hwnd, GWL_EXSTYLE,
+                               style | WS_EX_LAYERED | WS_EX_TRANSPARENT)
         else:
             # Settings mode: remove transparent flag
-            ctypes.windll.user32.SetWindowLongW(self.hwnd, GWL_EXSTYLE,
-                                                style & ~WS_EX_TRANSPARENT)
+            _SetWindowLongPtrW(self.hwnd, GWL_EXSTYLE,
+                               style & ~WS_EX_TRANSPARENT)
             
     def _create_tray(self):
         self.tray = QtWidgets.QSystemTrayIcon(self)
@@ -558,19 +847,21 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._settings_mode:
             self.panel.show()
             self.panel.raise_()
-            self.tray.contextMenu().actions()[0].setText("Close Settings")
+            self.act_toggle_settings.setText("Close Settings")
         else:
             self.panel.hide()
-            self.tray.contextMenu().actions()[0].setText("Open Settings")
+            self.act_toggle_settings.setText("Open Settings")
 
         # Canvas interactivity
         self.canvas.setInteractive(self._settings_mode)
 
-        # Guides visibility
-        self.setVisible(self._guides_visible)
-        self.tray.contextMenu().actions()[1].setText("Show Guides" if not self._guides_visible else "Hide Guides")
+        # Guides visibility: hide only the canvas so the window manager keeps the
+        # fullscreen layered window alive instead of tearing it down on every toggle
+        self.canvas.setVisible(self._guides_visible)
+        self.act_toggle_guides.setText("Show Guides" if not self._guides_visible else "Hide Guides")
 
-    def _load_settings(self):
+    def _read_settings_from_disk(self) -> dict:
+        """Read the settings file; touches no Qt objects, so it is safe off the GUI thread."""
         if not os.path.exists(SETTINGS_FILE):
             print(f"Settings file not found, creating default at: {SETTINGS_FILE}")
             self._write_default_settings()
@@ -578,10 +869,16 @@ class MainWindow(QtWidgets.QMainWindow):
             print(f"Loading settings from: {SETTINGS_FILE}")
             with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+            # settingsLoaded carries a dict; anything else would fail the emit in the
+            # pool thread and leave saving disabled for the whole session
+            if not isinstance(data, dict):
+                raise ValueError(f"expected a JSON object, got {type(data).__name__}")
         except Exception as e:
             print(f"Error loading settings: {e}")
             data = self._default_settings_dict()
+        return data
 
+    def _apply_loaded_settings(self, data: dict):
         # load guides
         guides_data = data.get("guides", [])
         guides = []
@@ -604,14 +901,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # other state
         self._guides_visible = bool(data.get("show_guides", True))
-        self._settings_mode = False
+        self._settings_loaded = True
+        self._apply_modes()
 
     def _write_default_settings(self):
         data = self._default_settings_dict()
         try:
             print(f"Writing default settings to: {SETTINGS_FILE}")
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            self._write_settings_file(data)
         except Exception as e:
             print(f"Error writing default settings: {e}")
 
@@ -627,6 +924,9 @@ class MainWindow(QtWidgets.QMainWindow):
         }
 
     def _save_settings(self):
+        if not self._settings_loaded:
+            # Don't overwrite the file with defaults before it has been read
+            return
         data = {
             "guides": [asdict(g) for g in self.canvas.guides()],
             "settings": self.panel.getDefaults(),
@@ -634,11 +934,25 @@ class MainWindow(QtWidgets.QMainWindow):
         }
         try:
             print(f"Saving settings to: {SETTINGS_FILE}")
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            self._write_settings_file(data)
         except Exception as e:
             print(f"Error saving settings: {e}")
 
+    def _write_settings_file(self, data):
+        """Write data as compact JSON, atomically replacing the settings file."""
+        # Write to a temp file and swap it in so a crash never leaves a truncated file
+        tmp_path = SETTINGS_FILE + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, SETTINGS_FILE)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def quitApp(self):
         self._save_settings()
         QtWidgets.QApplication.quit()
@@ -658,8 +972,6 @@ def main():
     app.setWindowIcon(create_orange_cross_icon(32))
 
     win = MainWindow()
-    if not win._guides_visible:
-        win.hide()
 
     sys.exit(app.exec_())
 